@@ -1,22 +1,110 @@
 import streamlit as st
-import plotly.express as px
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from typing import List, Tuple
 import sys
 import os
 import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scraper import IndeedScraper, LinkedInScraper
+from scraper import IndeedScraper, JobRecord, LinkedInScraper
 from processor.job_processor import JobProcessor
 
+_log = logging.getLogger(__name__)
+
+@st.cache_resource(show_spinner=False)
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Start one event loop in a background thread that outlives every rerun.
+
+    Scraper sessions are bound to the loop they were opened on, so keeping a
+    single loop lets their connection pools be reused between clicks.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def _close_scrapers(loop: asyncio.AbstractEventLoop, scrapers: Tuple[IndeedScraper, LinkedInScraper]):
+    """Close the scrapers' HTTP sessions on the loop that opened them."""
+    if not loop.is_running():
+        return
+
+    async def close_all():
+        await asyncio.gather(*(scraper.close() for scraper in scrapers))
+
+    future = asyncio.run_coroutine_threadsafe(close_all(), loop)
+    try:
+        future.result(timeout=5)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        _log.warning("Timed out closing the scraper sessions")
+
+def _close_open_scrapers(opened: List[Tuple[asyncio.AbstractEventLoop, Tuple[IndeedScraper, LinkedInScraper]]]):
+    """Close and forget every scraper pair in opened."""
+    while opened:
+        _close_scrapers(*opened.pop())
+
+@st.cache_resource(show_spinner=False)
+def _open_scrapers() -> List[Tuple[asyncio.AbstractEventLoop, Tuple[IndeedScraper, LinkedInScraper]]]:
+    """Track the scrapers whose sessions are open, with the loop that owns them.
+
+    Cached so the exit hook that closes them is registered once per server
+    process, not on every rerun.
+    """
+    opened = []
+    atexit.register(_close_open_scrapers, opened)
+    return opened
+
+@st.cache_resource(show_spinner=False)
+def _scrapers() -> Tuple[IndeedScraper, LinkedInScraper]:
+    """Create the scrapers once per server process instead of once per rerun.
+
+    Their sessions live as long as the server. If this entry is rebuilt
+    (e.g. the cache was cleared), the scrapers it replaces are closed first;
+    the current ones are closed at exit.
+    """
+    opened = _open_scrapers()
+    _close_open_scrapers(opened)
+    scrapers = (IndeedScraper(), LinkedInScraper())
+    opened.append((_event_loop(), scrapers))
+    return scrapers
+
+# Longest a click waits for the scrapers, in seconds; retries back off for up to a few minutes
+_SEARCH_TIMEOUT = 300
+
+class NoJobsFoundError(Exception):
+    """Raised when a search returns no jobs, so the empty result is not cached."""
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def _fetch_jobs_cached(_dashboard: "JobMarketDashboard", query: str, location: str,
+                       sources: Tuple[str, ...], num_pages: int) -> pd.DataFrame:
+    """Fetch jobs once per search and cache the result as a DataFrame.
+
+    The dashboard argument is excluded from the cache key (leading underscore),
+    so only the search parameters decide whether the network is hit again.
+    Empty results raise instead of returning, because st.cache_data does not
+    cache exceptions: a failed or rate-limited scrape is retried on the next click.
+    """
+    search = _dashboard.fetch_jobs(query, location, list(sources), num_pages)
+    future = asyncio.run_coroutine_threadsafe(search, _event_loop())
+    try:
+        jobs = future.result(timeout=_SEARCH_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+    if not jobs:
+        raise NoJobsFoundError()
+    return pd.DataFrame([job.to_dict() for job in jobs])
+
 class JobMarketDashboard:
     def __init__(self):
         self.job_processor = JobProcessor()
-        self.indeed_scraper = IndeedScraper()
-        self.linkedin_scraper = LinkedInScraper()
+        self.indeed_scraper, self.linkedin_scraper = _scrapers()
 
     def run(self):
         st.set_page_config(page_title="Job Market Analyzer", layout="wide")
@@ -35,41 +123,60 @@ class JobMarketDashboard:
         # Main panel content
         if analyze_button:
             with st.spinner("Fetching job data..."):
-                jobs = asyncio.run(self.fetch_jobs(query, location, source, num_pages))
-                if jobs:
-                    # Filter jobs by work type
-                    filtered_jobs = self.job_processor.filter_jobs_by_work_type(jobs, work_type)
-                    self.display_insights(filtered_jobs)
-                else:
+                # Cached by search parameters, so changing only the work type skips the scrape
+                try:
+                    jobs = _fetch_jobs_cached(self, query, location, tuple(source), num_pages)
+                except NoJobsFoundError:
                     st.error("No jobs found. Please try different search parameters.")
+                except concurrent.futures.TimeoutError:
+                    st.error("The job search took too long. Please try again in a few minutes.")
+                else:
+                    self.display_insights(jobs, work_type)
 
-    async def fetch_jobs(self, query: str, location: str, sources: List[str], num_pages: int) -> List[Dict]:
-        """Fetch jobs from selected sources."""
-        jobs = []
+    async def fetch_jobs(self, query: str, location: str, sources: List[str], num_pages: int) -> List[JobRecord]:
+        """Fetch jobs from selected sources concurrently, without duplicate listings."""
+        searches = []
         if "Indeed" in sources:
-            indeed_jobs = await self.indeed_scraper.search_jobs(query, location, num_pages)
-            jobs.extend(indeed_jobs)
+            searches.append(self.indeed_scraper.search_jobs(query, location, num_pages))
         if "LinkedIn" in sources:
-            linkedin_jobs = await self.linkedin_scraper.search_jobs(query, location, num_pages)
-            jobs.extend(linkedin_jobs)
+            searches.append(self.linkedin_scraper.search_jobs(query, location, num_pages))
+        results = await asyncio.gather(*searches)
+
+        # Sources overlap, so drop repeated listings before any per-job analysis
+        seen = set()
+        jobs = []
+        for source_jobs in results:
+            for job in source_jobs:
+                key = job.url or (job.title, job.company, job.location)
+                if key in seen:
+                    continue
+                seen.add(key)
+                jobs.append(job)
         return jobs
 
-    def display_insights(self, jobs: List[Dict]):
+    def display_insights(self, jobs: pd.DataFrame, work_type: str = "All"):
         """Display various insights from job data."""
+        # Imported here so plotly only loads once there is something to chart
+        import plotly.express as px
+
         try:
             st.title("Job Market Analysis Results")
+
+            # Filter by work type and compute every statistic in one pass over the jobs
+            insights = self.job_processor.analyze_all(jobs, work_type)
+            df = insights.jobs
             
             # Create three columns for key metrics
             col1, col2, col3 = st.columns(3)
 
-            total_jobs = len(jobs)
+            total_jobs = len(df)
             with col1:
                 st.metric("Total Jobs Found", total_jobs)
             with col2:
-                unique_companies = len(set(job['company'] for job in jobs if job.get('company')))
+                unique_companies = int(df['company'].replace('', np.nan).nunique())
                 st.metric("Unique Companies", unique_companies)
             with col3:
-                salary_insights = self.job_processor.get_salary_insights(jobs)
+                salary_insights = insights.salary_insights
                 if salary_insights['average_salary'] > 0:
                     st.metric("Average Salary", f"${salary_insights['average_salary']:,.2f}/year")
                 else:
@@ -78,10 +185,10 @@ class JobMarketDashboard:
             if total_jobs > 0:
                 # Skills Analysis
                 st.header("Skills in Demand")
-                skill_trends = self.job_processor.get_skill_trends(jobs)
+                skill_trends = insights.skill_trends
                 if skill_trends:
-                    skill_df = pd.DataFrame(list(skill_trends.items()), columns=['Skill', 'Count'])
-                    skill_df = skill_df.sort_values('Count', ascending=False).head(10)
+                    top_skills = pd.Series(skill_trends).nlargest(10)
+                    skill_df = top_skills.rename_axis('Skill').reset_index(name='Count')
                     if not skill_df.empty:
                         fig = px.bar(skill_df, x='Skill', y='Count',
                                     title='Top 10 Most In-Demand Skills')
@@ -91,7 +198,7 @@ class JobMarketDashboard:
 
                 # Work Type Distribution
                 st.header("Work Type Distribution")
-                work_type_dist = self.job_processor.get_work_type_distribution(jobs)
+                work_type_dist = insights.work_type_distribution
                 if work_type_dist:
                     work_type_df = pd.DataFrame(list(work_type_dist.items()),
                                             columns=['Work Type', 'Job Count'])
@@ -104,7 +211,7 @@ class JobMarketDashboard:
 
                 # Location Analysis
                 st.header("Job Distribution by Location")
-                location_trends = self.job_processor.get_location_trends(jobs)
+                location_trends = insights.location_trends
                 if location_trends:
                     location_df = pd.DataFrame(list(location_trends.items()), 
                                             columns=['Location', 'Job Count'])
@@ -136,13 +243,13 @@ class JobMarketDashboard:
 
                 # Recent Job Listings
                 st.header("Recent Job Listings")
-                for job in jobs[:10]:  # Display most recent 10 jobs
+                for job in df.head(10).to_dict('records'):  # Display most recent 10 jobs
                     try:
                         with st.expander(f"{job.get('title', 'Untitled')} at {job.get('company', 'Unknown Company')}"):
                             st.write(f"🏢 Company: {job.get('company', 'Unknown')}")
                             st.write(f"📍 Location: {job.get('location', 'Location not specified')}")
                             if job.get('salary_range'):
-                                salary_data = self.job_processor.analyze_salary_range(job['salary_range'])
+                                salary_data = job['parsed_salary']
                                 if salary_data['min_salary'] == salary_data['max_salary']:
                                     if salary_data['average_salary'] > 0:
                                         st.write(f"💰 Salary: ${salary_data['average_salary']:,.2f}/year")
@@ -1,40 +1,250 @@
-import spacy
-from typing import Dict, List, Set
+import re
+import functools
+import ahocorasick
+import numpy as np
+import pandas as pd
+from typing import Dict, NamedTuple, Set
 from collections import Counter
 from datetime import datetime
 
+# Salary parsing patterns, compiled once at import
+_SALARY_STRIP = str.maketrans('', '', '$,')
+_NUM_RE = re.compile(r'\d+(?:\.\d+)?')
+_MAGNITUDE_MULTIPLIERS = {
+    'k': 1000,
+    'm': 1000000,
+    'thousand': 1000,
+    'million': 1000000
+}
+# Letter lookarounds rather than \b so that suffixes glued to digits ('120k') still match
+_MAG_RE = re.compile(r'(?<![a-z])(k|m|thousand|million)(?![a-z])')
+_TIME_MULTIPLIERS = {
+    '/hr': 2080,   # 40 hours * 52 weeks
+    'per hour': 2080,
+    'hourly': 2080,
+    '/day': 260,
+    'per day': 260,
+    'daily': 260,
+    '/wk': 52,
+    'per week': 52,
+    'weekly': 52,
+    '/mo': 12,
+    'per month': 12,
+    'monthly': 12
+}
+_TIME_RE = re.compile('|'.join(re.escape(pattern) for pattern in _TIME_MULTIPLIERS))
+
+_WORK_TYPE_KEYWORDS = {
+    'On-site': ['on-site', 'onsite', 'in office', 'in-office', 'office based', 'office-based', 'on location', 'on-location', 'physical location'],
+    'Remote': ['remote', 'work from home', 'wfh', 'virtual', 'telecommute', 'telework', '100% remote', 'fully remote'],
+    'Hybrid': ['hybrid', 'flexible', 'partially remote', 'remote optional', 'flexible work arrangement', 'mix of remote and office']
+}
+# Phrases that mark a keyword as part of a job requirements/location section
+_WORK_TYPE_CONTEXT = ['job type:', 'work arrangement:', 'location:', 'position type:']
+# Tie-break order when several work types score the same
+_WORK_TYPE_PRIORITY = ['Remote', 'Hybrid', 'On-site']
+
+# Every work-type keyword in one alternation, longest first so phrases beat the words inside them
+_WORK_TYPE_OF = {keyword: work_type
+                 for work_type, keywords in _WORK_TYPE_KEYWORDS.items() for keyword in keywords}
+_KEYWORDS = sorted(_WORK_TYPE_OF, key=len, reverse=True)
+# One pattern without named groups; _WORK_TYPE_OF maps each hit back to its work type
+_WORK_TYPE_RE = re.compile('|'.join(re.escape(keyword) for keyword in _KEYWORDS))
+# The longest match at a position also implies every shorter keyword it starts with, e.g. 'remote optional' -> 'remote'
+_PREFIX_KEYWORDS = {keyword: [other for other in _KEYWORDS if keyword.startswith(other)]
+                    for keyword in _KEYWORDS}
+_CONTEXT_RE = re.compile('|'.join(re.escape(context) for context in _WORK_TYPE_CONTEXT))
+_NEGATIONS = ('not ', 'no ')
+
+@functools.lru_cache(maxsize=8192)
+def _detect_work_type(description: str) -> str:
+    """Cached work-type detection shared by every JobProcessor.
+
+    Finds all keywords in a single regex scan instead of one substring
+    search per keyword, negation and context phrase. Expects lowercased text.
+    """
+    if not description:
+        return 'Unknown'
+        
+    found = set()
+    negated = set()
+
+    # Resume one character past each hit so overlapping keywords
+    # ('physical location' / 'on location') are all seen
+    match = _WORK_TYPE_RE.search(description)
+    while match:
+        start = match.start()
+        negation = description[max(0, start - 4):start].endswith(_NEGATIONS)
+        for keyword in _PREFIX_KEYWORDS[match.group()]:
+            found.add(keyword)
+            if negation:
+                negated.add(keyword)
+        match = _WORK_TYPE_RE.search(description, start + 1)
+
+    if not found:
+        return 'Unknown'
+
+    # Higher weight for phrases that appear in job requirements or location sections
+    weight = 2 if _CONTEXT_RE.search(description) else 1
+    matches = {work_type: 0 for work_type in _WORK_TYPE_KEYWORDS.keys()}
+    for keyword in found:
+        matches[_WORK_TYPE_OF[keyword]] += weight
+    for keyword in negated:
+        matches[_WORK_TYPE_OF[keyword]] -= 1
+    
+    # Advanced decision making
+    # Filter out negative scores
+    valid_matches = {k: v for k, v in matches.items() if v > 0}
+    if valid_matches:
+        max_matches = max(valid_matches.values())
+        max_types = [wt for wt, count in valid_matches.items() if count == max_matches]
+        
+        # If single clear winner
+        if len(max_types) == 1:
+            return max_types[0]
+            
+        # If multiple matches with same score, use priority
+        for work_type in _WORK_TYPE_PRIORITY:
+            if work_type in max_types:
+                return work_type
+    
+    return 'Unknown'
+
+@functools.lru_cache(maxsize=8192)
+def _analyze_salary_range(salary_text: str) -> Dict[str, float]:
+    """Cached salary parsing; callers must not mutate the returned dict."""
+    try:
+        if not salary_text:
+            return {'min_salary': 0.0, 'max_salary': 0.0, 'average_salary': 0.0}
+
+        # Drop currency symbols and thousands separators in one pass
+        cleaned = salary_text.lower().translate(_SALARY_STRIP)
+
+        # One scan each for the pay period and the magnitude suffix
+        time_match = _TIME_RE.search(cleaned)
+        time_multiplier = _TIME_MULTIPLIERS[time_match.group()] if time_match else 1
+        magnitude_match = _MAG_RE.search(cleaned)
+        magnitude_multiplier = _MAGNITUDE_MULTIPLIERS[magnitude_match.group(1)] if magnitude_match else 1
+
+        # Extract numbers and apply both multipliers
+        multiplier = magnitude_multiplier * time_multiplier
+        numbers = [float(n) * multiplier for n in _NUM_RE.findall(cleaned)]
+        
+        # Validate and filter numbers
+        numbers = [n for n in numbers if 10000 <= n <= 1000000]  # Annual salary range
+        
+        if len(numbers) >= 2:
+            min_sal = min(numbers)
+            max_sal = max(numbers)
+            return {
+                'min_salary': round(min_sal, 2),
+                'max_salary': round(max_sal, 2),
+                'average_salary': round((min_sal + max_sal) / 2, 2)
+            }
+        elif len(numbers) == 1:
+            salary = numbers[0]
+            return {
+                'min_salary': round(salary * 0.9, 2),  # Estimate range as ±10% of single value
+                'max_salary': round(salary * 1.1, 2),
+                'average_salary': round(salary, 2)
+            }
+        
+    except Exception as e:
+        print(f"Error parsing salary: {str(e)}")
+    
+    return {
+        'min_salary': 0.0,
+        'max_salary': 0.0,
+        'average_salary': 0.0
+    }
+
+class JobInsights(NamedTuple):
+    """Everything the dashboard shows for one set of job listings."""
+    jobs: pd.DataFrame
+    work_type_distribution: Dict[str, int]
+    salary_insights: Dict[str, float]
+    skill_trends: Dict[str, int]
+    location_trends: Dict[str, int]
+
 class JobProcessor:
     """Process job listings to extract insights and analyze trends."""
 
     def __init__(self):
-        """Initialize the job processor with NLP model."""
-        self.nlp = spacy.load('en_core_web_sm')
+        """Initialize the job processor with the skill matcher."""
         self.common_skills = set(['python', 'java', 'javascript', 'sql', 'aws',
                                 'react', 'node.js', 'docker', 'kubernetes',
                                 'machine learning', 'data analysis'])
-        self.work_type_keywords = {
-            'On-site': ['on-site', 'onsite', 'in office', 'in-office', 'office based', 'office-based', 'on location', 'on-location', 'physical location'],
-            'Remote': ['remote', 'work from home', 'wfh', 'virtual', 'telecommute', 'telework', '100% remote', 'fully remote'],
-            'Hybrid': ['hybrid', 'flexible', 'partially remote', 'remote optional', 'flexible work arrangement', 'mix of remote and office']
-        }
+        self._skill_automaton = ahocorasick.Automaton()
+        for skill in self.common_skills:
+            self._skill_automaton.add_word(skill, skill)
+        self._skill_automaton.make_automaton()
 
     def extract_skills(self, text: str) -> Set[str]:
-    
-        doc = self.nlp(text.lower())
+        """Extract known skills from text in a single Aho-Corasick scan.
+
+        Args:
+            text (str): Job description or any free text
+
+        Returns:
+            Set[str]: Skills from the known skill set found in the text
+        """
+        return self._match_skills(text.lower())
+
+    def _match_skills(self, text: str) -> Set[str]:
+        """Match known skills in text that is already lowercased."""
         skills = set()
 
-        # Extract skills based on pattern matching and known skill set
-        for token in doc:
-            if token.text in self.common_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., 'machine learning')
-            if token.i < len(doc) - 1:
-                bigram = f"{token.text} {doc[token.i + 1].text}"
-                if bigram in self.common_skills:
-                    skills.add(bigram)
+        # Only keep hits that sit on word boundaries (e.g. 'java' in 'javascript' is not a hit)
+        for end, skill in self._skill_automaton.iter(text):
+            start = end - len(skill) + 1
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end + 1 < len(text) and text[end + 1].isalnum():
+                continue
+            skills.add(skill)
 
         return skills
 
+    def get_skill_trends(self, jobs: pd.DataFrame) -> Dict[str, int]:
+        """Analyze skill frequency across job listings.
+
+        Args:
+            jobs (pd.DataFrame): Job listings, one row per job
+
+        Returns:
+            Dict[str, int]: Skill frequency count
+        """
+        skill_counts = Counter()
+        for skills in self._matched_skills(jobs):
+            skill_counts.update(skills)
+        return dict(skill_counts)
+
+    def get_location_trends(self, jobs: pd.DataFrame) -> Dict[str, int]:
+        """Analyze job distribution by location.
+
+        Args:
+            jobs (pd.DataFrame): Job listings, one row per job
+
+        Returns:
+            Dict[str, int]: Job count by location
+        """
+        locations = jobs['location'].fillna('')
+        locations = locations[locations != '']
+        return locations.str.split(',').str[0].str.strip().value_counts().to_dict()
+
+    def detect_work_type(self, description: str) -> str:
+        """Detect whether a job is on-site, remote or hybrid from its description.
+
+        Args:
+            description (str): Job description text
+
+        Returns:
+            str: 'On-site', 'Remote', 'Hybrid' or 'Unknown'
+        """
+        if not description:
+            return 'Unknown'
+        return _detect_work_type(str(description).lower())
+
     def analyze_salary_range(self, salary_text: str) -> Dict[str, float]:
         """Parse and normalize salary information with improved handling of various formats.
 
@@ -44,294 +254,126 @@ class JobProcessor:
         Returns:
             Dict[str, float]: Normalized salary range with min, max, and average
         """
-        try:
-            if not salary_text or not isinstance(salary_text, str):
-                return {'min_salary': 0.0, 'max_salary': 0.0, 'average_salary': 0.0}
-
-            # Remove currency symbols and normalize text
-            cleaned = salary_text.lower().strip()
-            cleaned = cleaned.replace('$', '').replace(',', '')
-            cleaned = cleaned.replace('usd', '').replace('us', '')
-            
-            # Handle various salary formats and multipliers
-            multipliers = {
-                'k': 1000,
-                'm': 1000000,
-                'thousand': 1000,
-                'million': 1000000
-            }
-            
-            for key, multiplier in multipliers.items():
-                if key in cleaned:
-                    cleaned = cleaned.replace(key, '')
-                    cleaned = cleaned.strip()
-                    # Extract numbers before applying multiplier
-                    import re
-                    numbers = [float(n) * multiplier for n in re.findall(r'\d+(?:\.\d+)?', cleaned)]
-                    break
-            else:
-                # If no multiplier found, extract numbers normally
-                numbers = [float(n) for n in re.findall(r'\d+(?:\.\d+)?', cleaned)]
-            
-            # Determine if salary is hourly/monthly/yearly
-            time_multipliers = {
-                '/hr': 2080,  # 40 hours * 52 weeks
-                'per hour': 2080,
-                'hourly': 2080,
-                '/mo': 12,    # 12 months per year
-                'per month': 12,
-                'monthly': 12
-            }
-            
-            # Apply time-based multiplier if found
-            for pattern, multiplier in time_multipliers.items():
-                if pattern in cleaned:
-                    numbers = [n * multiplier for n in numbers]
-                    break
-            
-            # Handle edge cases and validate numbers
-            numbers = [n for n in numbers if 10000 <= n <= 1000000]  # Filter unlikely salaries
-            
-            if len(numbers) >= 2:
-                min_sal = min(numbers)
-                max_sal = max(numbers)
-                return {
-                    'min_salary': round(min_sal, 2),
-                    'max_salary': round(max_sal, 2),
-                    'average_salary': round((min_sal + max_sal) / 2, 2)
-                }
-            elif len(numbers) == 1:
-                salary = numbers[0]
-                return {
-                    'min_salary': round(salary, 2),
-                    'max_salary': round(salary, 2),
-                    'average_salary': round(salary, 2)
-                }
-            
-        except Exception as e:
-            print(f"Error parsing salary: {str(e)}")
-        
-        return {
-            'min_salary': 0.0,
-            'max_salary': 0.0,
-            'average_salary': 0.0
-        }
+        if not salary_text or not isinstance(salary_text, str):
+            return {'min_salary': 0.0, 'max_salary': 0.0, 'average_salary': 0.0}
+        return dict(_analyze_salary_range(salary_text))
 
-    def get_skill_trends(self, jobs: List[Dict]) -> Dict[str, int]:
-        """Analyze skill frequency across job listings.
+    def detect_work_types(self, jobs: pd.DataFrame) -> pd.Series:
+        """Detect the work type of every job listing.
+
+        Each description gets one scan of the combined keyword regex, and
+        repeated descriptions are served from the detection cache.
 
         Args:
-            jobs (List[Dict]): List of job listings
+            jobs (pd.DataFrame): Job listings, one row per job
 
         Returns:
-            Dict[str, int]: Skill frequency count
+            pd.Series: Work type per job, aligned with the index of jobs
         """
-        all_skills = []
-        for job in jobs:
-            description = job.get('description', '')
-            skills = self.extract_skills(description)
-            all_skills.extend(list(skills))
-        
-        return dict(Counter(all_skills))
+        if jobs.empty:
+            return pd.Series([], index=jobs.index, dtype=object)
+        return self._descriptions(jobs).map(_detect_work_type)
 
-    def get_location_trends(self, jobs: List[Dict]) -> Dict[str, int]:
-        """Analyze job distribution by location.
+    def lowercase_descriptions(self, jobs: pd.DataFrame) -> pd.Series:
+        """Lowercase every job description in one pass.
 
         Args:
-            jobs (List[Dict]): List of job listings
+            jobs (pd.DataFrame): Job listings, one row per job
 
         Returns:
-            Dict[str, int]: Job count by location
+            pd.Series: Lowercased description per job, aligned with the index of jobs
         """
-        locations = [job.get('location', '').split(',')[0].strip() 
-                    for job in jobs if job.get('location')]
-        return dict(Counter(locations))
+        return jobs['description'].fillna('').astype(str).str.lower()
 
-    def detect_work_type(self, description: str) -> str:
-        if not description:
-            return 'Unknown'
-            
-        description = description.lower()
-        matches = {work_type: 0 for work_type in self.work_type_keywords.keys()}
-        
-        # Enhanced pattern matching with context awareness
-        for work_type, keywords in self.work_type_keywords.items():
-            for keyword in keywords:
-                # Check for exact matches and surrounding context
-                if keyword in description:
-                    # Higher weight for phrases that appear in job requirements or location sections
-                    if any(context in description for context in ['job type:', 'work arrangement:', 'location:', 'position type:']):
-                        matches[work_type] += 2
-                    else:
-                        matches[work_type] += 1
-                        
-                # Check for negations
-                if f'not {keyword}' in description or f'no {keyword}' in description:
-                    matches[work_type] -= 1
-        
-        # Advanced decision making
-        if matches:
-            # Filter out negative scores
-            valid_matches = {k: v for k, v in matches.items() if v > 0}
-            if valid_matches:
-                max_matches = max(valid_matches.values())
-                max_types = [wt for wt, count in valid_matches.items() if count == max_matches]
-                
-                # If single clear winner
-                if len(max_types) == 1:
-                    return max_types[0]
-                    
-                # If multiple matches with same score, use priority
-                priority_order = ['Remote', 'Hybrid', 'On-site']
-                for work_type in priority_order:
-                    if work_type in max_types:
-                        return work_type
-        
-        return 'Unknown'
+    def _descriptions(self, jobs: pd.DataFrame) -> pd.Series:
+        """Return the description_lc column, lowercasing descriptions only if it was not stored yet."""
+        if 'description_lc' in jobs.columns:
+            return jobs['description_lc']
+        return self.lowercase_descriptions(jobs)
 
-    def analyze_salary_range(self, salary_text: str) -> Dict[str, float]:
-        try:
-            if not salary_text or not isinstance(salary_text, str):
-                return {'min_salary': 0.0, 'max_salary': 0.0, 'average_salary': 0.0}
-
-            # Enhanced cleaning and normalization
-            cleaned = salary_text.lower().strip()
-            cleaned = cleaned.replace('$', '').replace(',', '')
-            cleaned = cleaned.replace('usd', '').replace('us', '')
-            
-            # Handle ranges with various separators
-            range_separators = ['-', 'to', '~', 'through', 'up to']
-            
-            # Handle various salary formats and multipliers with improved accuracy
-            multipliers = {
-                'k': 1000,
-                'm': 1000000,
-                'thousand': 1000,
-                'million': 1000000,
-                'yr': 1,
-                'year': 1,
-                'annual': 1
-            }
-            
-            # Time-based multipliers with improved accuracy
-            time_multipliers = {
-                '/hr': 2080,
-                'per hour': 2080,
-                'hourly': 2080,
-                '/day': 260,
-                'per day': 260,
-                'daily': 260,
-                '/wk': 52,
-                'per week': 52,
-                'weekly': 52,
-                '/mo': 12,
-                'per month': 12,
-                'monthly': 12
-            }
-            
-            # Apply multipliers
-            import re
-            numbers = []
-            
-            # First check for time-based multipliers
-            time_multiplier = 1
-            for pattern, mult in time_multipliers.items():
-                if pattern in cleaned:
-                    time_multiplier = mult
-                    cleaned = cleaned.replace(pattern, '')
-                    break
-            
-            # Then check for magnitude multipliers
-            magnitude_multiplier = 1
-            for key, mult in multipliers.items():
-                if key in cleaned:
-                    magnitude_multiplier = mult
-                    cleaned = cleaned.replace(key, '')
-                    break
-            
-            # Extract numbers and apply both multipliers
-            raw_numbers = re.findall(r'\d+(?:\.\d+)?', cleaned)
-            numbers = [float(n) * magnitude_multiplier * time_multiplier for n in raw_numbers]
-            
-            # Validate and filter numbers
-            numbers = [n for n in numbers if 10000 <= n <= 1000000]  # Annual salary range
-            
-            if len(numbers) >= 2:
-                min_sal = min(numbers)
-                max_sal = max(numbers)
-                return {
-                    'min_salary': round(min_sal, 2),
-                    'max_salary': round(max_sal, 2),
-                    'average_salary': round((min_sal + max_sal) / 2, 2)
-                }
-            elif len(numbers) == 1:
-                salary = numbers[0]
-                return {
-                    'min_salary': round(salary * 0.9, 2),  # Estimate range as ±10% of single value
-                    'max_salary': round(salary * 1.1, 2),
-                    'average_salary': round(salary, 2)
-                }
-            
-        except Exception as e:
-            print(f"Error parsing salary: {str(e)}")
-        
-        return {
-            'min_salary': 0.0,
-            'max_salary': 0.0,
-            'average_salary': 0.0
-        }
+    def _work_types(self, jobs: pd.DataFrame) -> pd.Series:
+        """Return the work_type column, detecting it only if it was not stored yet."""
+        if 'work_type' in jobs.columns:
+            return jobs['work_type']
+        return self.detect_work_types(jobs)
 
-    def filter_jobs_by_work_type(self, jobs: List[Dict], work_type: str) -> List[Dict]:
+    def filter_jobs_by_work_type(self, jobs: pd.DataFrame, work_type: str) -> pd.DataFrame:
         """Filter jobs by work type.
 
         Args:
-            jobs (List[Dict]): List of job listings
+            jobs (pd.DataFrame): Job listings, one row per job
             work_type (str): Work type to filter by
 
         Returns:
-            List[Dict]: Filtered job listings
+            pd.DataFrame: Filtered job listings
         """
         if work_type == 'All':
             return jobs
-        return [job for job in jobs if self.detect_work_type(job.get('description', '')) == work_type]
+        return jobs[self._work_types(jobs) == work_type]
 
-    def get_work_type_distribution(self, jobs: List[Dict]) -> Dict[str, int]:
+    def get_work_type_distribution(self, jobs: pd.DataFrame) -> Dict[str, int]:
         """Get distribution of jobs by work type.
 
         Args:
-            jobs (List[Dict]): List of job listings
+            jobs (pd.DataFrame): Job listings, one row per job
 
         Returns:
             Dict[str, int]: Count of jobs by work type
         """
-        work_types = [self.detect_work_type(job.get('description', '')) for job in jobs]
-        return dict(Counter(work_types))
+        return self._work_types(jobs).value_counts().to_dict()
+
+    def parse_salaries(self, jobs: pd.DataFrame) -> pd.Series:
+        """Parse the salary text of every job listing.
+
+        Args:
+            jobs (pd.DataFrame): Job listings, one row per job
+
+        Returns:
+            pd.Series: Salary range dict per job, aligned with the index of jobs
+        """
+        if jobs.empty:
+            return pd.Series([], index=jobs.index, dtype=object)
+        return jobs['salary_range'].map(self.analyze_salary_range)
+
+    def match_job_skills(self, jobs: pd.DataFrame) -> pd.Series:
+        """Find the known skills in every job description.
+
+        Args:
+            jobs (pd.DataFrame): Job listings, one row per job
+
+        Returns:
+            pd.Series: Set of matched skills per job, aligned with the index of jobs
+        """
+        if jobs.empty:
+            return pd.Series([], index=jobs.index, dtype=object)
+        return self._descriptions(jobs).map(self._match_skills)
+
+    def _matched_skills(self, jobs: pd.DataFrame) -> pd.Series:
+        """Return the matched_skills column, matching skills only if it was not stored yet."""
+        if 'matched_skills' in jobs.columns:
+            return jobs['matched_skills']
+        return self.match_job_skills(jobs)
 
-    def get_salary_insights(self, jobs: List[Dict]) -> Dict[str, float]:
+    def _parsed_salaries(self, jobs: pd.DataFrame) -> pd.Series:
+        """Return the parsed_salary column, parsing it only if it was not stored yet."""
+        if 'parsed_salary' in jobs.columns:
+            return jobs['parsed_salary']
+        return self.parse_salaries(jobs)
+
+    def get_salary_insights(self, jobs: pd.DataFrame) -> Dict[str, float]:
         """Calculate salary statistics across job listings.
 
         Args:
-            jobs (List[Dict]): List of job listings
+            jobs (pd.DataFrame): Job listings, one row per job
 
         Returns:
             Dict[str, float]: Salary statistics
         """
-        salaries = []
-        for job in jobs:
-            try:
-                if job.get('salary_range'):
-                    salary_data = self.analyze_salary_range(job['salary_range'])
-                    if salary_data['average_salary'] > 0:
-                        salaries.append(salary_data['average_salary'])
-                elif 'salary' in job:
-                    salary_data = self.analyze_salary_range(str(job['salary']))
-                    if salary_data['average_salary'] > 0:
-                        salaries.append(salary_data['average_salary'])
-            except Exception as e:
-                print(f"Error processing salary for job {job.get('title', 'Unknown')}: {str(e)}")
-                continue
+        averages = self._parsed_salaries(jobs).map(lambda salary: salary['average_salary'])
+        salaries = averages.to_numpy(dtype=np.float64)
+        salaries = salaries[salaries > 0]
 
-        if not salaries:
+        if salaries.size == 0:
             return {
                 'min_salary': 0.0,
                 'max_salary': 0.0,
@@ -340,8 +382,46 @@ class JobProcessor:
             }
 
         return {
-            'min_salary': min(salaries),
-            'max_salary': max(salaries),
-            'average_salary': sum(salaries) / len(salaries),
-            'median_salary': sorted(salaries)[len(salaries) // 2]
-        }
\ No newline at end of file
+            'min_salary': float(salaries.min()),
+            'max_salary': float(salaries.max()),
+            'average_salary': float(salaries.mean()),
+            'median_salary': float(np.median(salaries))
+        }
+
+    def analyze_all(self, jobs: pd.DataFrame, work_type: str = 'All') -> JobInsights:
+        """Run every analysis over the job listings in a single pass.
+
+        Descriptions are lowercased and work types detected once, the work-type
+        filter is applied, and one loop over the remaining rows then matches
+        skills and parses salaries together. The results are stored as the
+        matched_skills and parsed_salary columns, which the public analysis
+        methods below read instead of recomputing them.
+
+        Args:
+            jobs (pd.DataFrame): Job listings, one row per job
+            work_type (str, optional): Work type to filter by. Defaults to 'All'.
+
+        Returns:
+            JobInsights: Filtered listings with their derived columns, plus all statistics
+        """
+        jobs = jobs.assign(description_lc=self.lowercase_descriptions(jobs))
+        jobs = jobs.assign(work_type=self.detect_work_types(jobs))
+        jobs = self.filter_jobs_by_work_type(jobs, work_type)
+
+        matched_skills = []
+        parsed_salaries = []
+        for description, salary_text in zip(jobs['description_lc'], jobs['salary_range']):
+            matched_skills.append(self._match_skills(description))
+            parsed_salaries.append(self.analyze_salary_range(salary_text))
+        jobs = jobs.assign(
+            matched_skills=pd.Series(matched_skills, index=jobs.index, dtype=object),
+            parsed_salary=pd.Series(parsed_salaries, index=jobs.index, dtype=object)
+        )
+
+        return JobInsights(
+            jobs=jobs,
+            work_type_distribution=self.get_work_type_distribution(jobs),
+            salary_insights=self.get_salary_insights(jobs),
+            skill_trends=self.get_skill_trends(jobs),
+            location_trends=self.get_location_trends(jobs)
+        )
\ No newline at end of file
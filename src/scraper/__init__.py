@@ -1,5 +1,5 @@
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, JobRecord
 from .indeed_scraper import IndeedScraper
 from .linkedin_scraper import LinkedInScraper
 
-__all__ = ['BaseScraper', 'IndeedScraper', 'LinkedInScraper']
\ No newline at end of file
+__all__ = ['BaseScraper', 'IndeedScraper', 'JobRecord', 'LinkedInScraper']
\ No newline at end of file
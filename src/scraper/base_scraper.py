@@ -1,6 +1,149 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from collections import OrderedDict
+import atexit
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from selectolax.lexbor import LexborHTMLParser
+import aiohttp
+import asyncio
+import logging
+import multiprocessing
+import os
+import random
+import threading
+import time
+
+_log = logging.getLogger(__name__)
+
+# Responses that mean "slow down and try again" rather than "this page is gone"
+_RETRY_STATUSES = frozenset({429, 503})
+# Longest wait honoured from a Retry-After header, in seconds
+_MAX_RETRY_DELAY = 60
+
+# Search pages hold only a few dozen cards, so a handful of parse workers is plenty
+_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+def _parse_pool_context():
+    """Return the multiprocessing context parse workers are started from.
+
+    Workers come from a forkserver rather than fork, because the pool is
+    started from a thread of a multithreaded server and forking there can
+    copy held locks (e.g. logging's) into the child. Platforms without
+    forkserver (Windows) use their default start method, which is spawn.
+    """
+    try:
+        return multiprocessing.get_context('forkserver')
+    except ValueError:
+        return multiprocessing.get_context()
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by all scrapers for HTML parsing.
+
+    The pool is created on first use and shut down when the interpreter exits.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=_PARSE_WORKERS,
+                                              mp_context=_parse_pool_context())
+        return _parse_pool
+
+def reset_parse_pool(broken: ProcessPoolExecutor):
+    """Discard a parse pool whose workers died, so the next call starts a new one.
+
+    Does nothing if another caller already replaced that pool.
+
+    Args:
+        broken (ProcessPoolExecutor): The pool that raised BrokenProcessPool
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is broken:
+            _parse_pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+@atexit.register
+def _shutdown_parse_pool():
+    """Shut down the current parse pool, if one was started."""
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+
+@dataclass(slots=True)
+class JobRecord:
+    """One normalized job listing.
+
+    Slotted, so a page of listings costs far less memory than the same
+    jobs held as dicts, and fields are read as attributes.
+    """
+    title: str
+    company: str
+    location: str
+    description: str
+    url: str
+    posted_date: str
+    source: str
+    salary_range: str = ''
+    skills: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        """Return the listing as a plain dict, e.g. for building a DataFrame."""
+        return {
+            'title': self.title,
+            'company': self.company,
+            'location': self.location,
+            'description': self.description,
+            'salary_range': self.salary_range,
+            'skills': self.skills,
+            'url': self.url,
+            'posted_date': self.posted_date,
+            'source': self.source
+        }
+
+def normalize_job_data(raw_job: Dict, default_source: str) -> JobRecord:
+    """Normalize raw job data into a standard format.
+
+    Module-level so that parsers running in worker processes can call it.
+
+    Args:
+        raw_job (Dict): Raw job data from scraper
+        default_source (str): Source to record when raw_job has none
+
+    Returns:
+        JobRecord: Normalized job data
+    """
+    return normalize_job_batch([raw_job], default_source)[0]
+
+def normalize_job_batch(raw_jobs: List[Dict], default_source: str) -> List[JobRecord]:
+    """Normalize a page of raw job data into the standard format in one call.
+
+    The fallback posted date is formatted once for the whole batch instead
+    of once per job.
+
+    Args:
+        raw_jobs (List[Dict]): Raw job data from scraper
+        default_source (str): Source to record for jobs that have none
+
+    Returns:
+        List[JobRecord]: Normalized job data, in the same order
+    """
+    now_iso = datetime.now().isoformat()
+    return [JobRecord(
+        title=raw_job.get('title', ''),
+        company=raw_job.get('company', ''),
+        location=raw_job.get('location', ''),
+        description=raw_job.get('description', ''),
+        salary_range=raw_job.get('salary_range', ''),
+        skills=raw_job.get('skills', []),
+        url=raw_job.get('url', ''),
+        posted_date=raw_job.get('posted_date', now_iso),
+        source=raw_job.get('source', default_source)
+    ) for raw_job in raw_jobs]
 
 class BaseScraper(ABC):
     """Base class for all job scrapers implementing common functionality."""
@@ -12,10 +155,102 @@ class BaseScraper(ABC):
             base_url (str): The base URL of the job board
         """
         self.base_url = base_url
+        self.headers: Dict[str, str] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Parsed job details by URL, with the monotonic time they were fetched, least recently used first
+        self._detail_cache: 'OrderedDict[str, Tuple[float, JobRecord]]' = OrderedDict()
+        self.detail_cache_ttl = 3600
+        self.detail_cache_size = 1024
+        # Upper bound on search pages downloaded at the same time
+        self.max_concurrent_pages = 5
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps DNS lookups and TLS connections alive
+        across search pages and job detail requests.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self._session
+
+    async def _fetch_html(self, url: str, max_tries: int = 5) -> Optional[bytes]:
+        """Download a page, retrying rate-limited and failed requests with backoff.
+
+        Waits for the server's Retry-After when it sends one (capped at
+        _MAX_RETRY_DELAY), otherwise for an exponentially growing delay with jitter. The body is returned as raw
+        bytes: both job boards serve UTF-8, so the HTML parser decodes it in C
+        and aiohttp's charset detection is skipped.
+
+        Args:
+            url (str): Page to download
+            max_tries (int, optional): Attempts before giving up. Defaults to 5.
+
+        Returns:
+            Optional[bytes]: Page HTML, or None if the server did not return it
+        """
+        session = await self._get_session()
+        for attempt in range(max_tries):
+            delay = 2 ** attempt + random.random()
+            try:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        return await response.read()
+                    if response.status not in _RETRY_STATUSES:
+                        _log.warning("Giving up on %s: HTTP %d", url, response.status)
+                        return None
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = min(float(retry_after), _MAX_RETRY_DELAY)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == max_tries - 1:
+                    raise
+            if attempt < max_tries - 1:
+                await asyncio.sleep(delay)
+        _log.warning("Giving up on %s: still rate limited after %d tries", url, max_tries)
+        return None
+
+    def _get_cached_details(self, job_url: str) -> Optional[JobRecord]:
+        """Return job details fetched within the cache TTL, or None."""
+        cached = self._detail_cache.get(job_url)
+        if cached is None:
+            return None
+        fetched_at, details = cached
+        if time.monotonic() - fetched_at >= self.detail_cache_ttl:
+            del self._detail_cache[job_url]
+            return None
+        self._detail_cache.move_to_end(job_url)
+        return replace(details, skills=list(details.skills))
+
+    def _cache_details(self, job_url: str, details: Optional[JobRecord]):
+        """Remember parsed job details so the same URL is not fetched again.
+
+        Evicts the least recently used entries once detail_cache_size is reached.
+        """
+        if details is None:
+            return
+        self._detail_cache[job_url] = (time.monotonic(), replace(details, skills=list(details.skills)))
+        self._detail_cache.move_to_end(job_url)
+        while len(self._detail_cache) > self.detail_cache_size:
+            self._detail_cache.popitem(last=False)
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool used for HTML parsing, shared with other scrapers."""
+        return get_parse_pool()
+
+    async def close(self):
+        """Close the shared HTTP session, if it was opened.
+
+        The parse pool is shared by every scraper and shut down at exit instead.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     @abstractmethod
     async def search_jobs(self, query: str, location: Optional[str] = None, 
-                         num_pages: int = 1) -> List[Dict]:
+                         num_pages: int = 1) -> List[JobRecord]:
         """Search for jobs based on query and location.
 
         Args:
@@ -24,39 +259,92 @@ class BaseScraper(ABC):
             num_pages (int, optional): Number of pages to scrape. Defaults to 1.
 
         Returns:
-            List[Dict]: List of job listings with details
+            List[JobRecord]: List of job listings with details
         """
         pass
 
-    @abstractmethod
-    async def get_job_details(self, job_url: str) -> Dict:
+    async def get_job_details(self, job_url: str) -> Optional[JobRecord]:
         """Get detailed information about a specific job.
 
         Args:
             job_url (str): URL of the job listing
 
         Returns:
-            Dict: Detailed job information
+            Optional[JobRecord]: Detailed job information, or None if it could not be fetched
+        """
+        details = self._get_cached_details(job_url)
+        if details is not None:
+            return details
+        try:
+            html = await self._fetch_html(job_url)
+            if html is not None:
+                details = self._parse_job_details(LexborHTMLParser(html), job_url)
+                self._cache_details(job_url, details)
+                return details
+        except Exception:
+            _log.exception("Error getting job details for %s", job_url)
+        return None
+
+    async def _search_pages(self, urls: List[str], parse_fn: Callable[..., List[JobRecord]],
+                            *parse_args) -> List[JobRecord]:
+        """Download search result pages concurrently and parse each one.
+
+        Args:
+            urls (List[str]): Search result pages to download
+            parse_fn (Callable): Module-level parser called as parse_fn(html, *parse_args)
+            *parse_args: Extra arguments passed to parse_fn after the page HTML
+
+        Returns:
+            List[JobRecord]: Jobs from every page that could be scraped, in page order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+        loop = asyncio.get_running_loop()
+
+        async def fetch_and_parse(url: str) -> List[JobRecord]:
+            async with semaphore:
+                html = await self._fetch_html(url)
+            if html is None:
+                return []
+            # Parsing runs in a worker process, so later pages keep downloading meanwhile
+            pool = self._get_parse_pool()
+            try:
+                return await loop.run_in_executor(pool, parse_fn, html, *parse_args)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for using too much memory); retry once on a fresh pool
+                _log.warning("Parse pool broke while parsing %s, restarting it", url)
+                reset_parse_pool(pool)
+                return await loop.run_in_executor(self._get_parse_pool(), parse_fn, html, *parse_args)
+
+        pages = await asyncio.gather(*(fetch_and_parse(url) for url in urls), return_exceptions=True)
+
+        jobs = []
+        for page, page_jobs in enumerate(pages):
+            if isinstance(page_jobs, Exception):
+                _log.warning("Error scraping page %d: %s", page, page_jobs)
+            else:
+                jobs.extend(page_jobs)
+        return jobs
+
+    @abstractmethod
+    def _parse_job_details(self, tree: LexborHTMLParser, job_url: str) -> Optional[JobRecord]:
+        """Parse a job detail page.
+
+        Args:
+            tree (LexborHTMLParser): Parsed HTML of the job detail page
+            job_url (str): URL of the job listing
+
+        Returns:
+            Optional[JobRecord]: Job details, or None if the page could not be parsed
         """
         pass
 
-    def _normalize_job_data(self, raw_job: Dict) -> Dict:
+    def _normalize_job_data(self, raw_job: Dict) -> JobRecord:
         """Normalize raw job data into a standard format.
 
         Args:
             raw_job (Dict): Raw job data from scraper
 
         Returns:
-            Dict: Normalized job data
+            JobRecord: Normalized job data
         """
-        return {
-            'title': raw_job.get('title', ''),
-            'company': raw_job.get('company', ''),
-            'location': raw_job.get('location', ''),
-            'description': raw_job.get('description', ''),
-            'salary_range': raw_job.get('salary_range', ''),
-            'skills': raw_job.get('skills', []),
-            'url': raw_job.get('url', ''),
-            'posted_date': raw_job.get('posted_date', datetime.now().isoformat()),
-            'source': raw_job.get('source', self.__class__.__name__)
-        }
\ No newline at end of file
+        return normalize_job_data(raw_job, self.__class__.__name__)
\ No newline at end of file
@@ -1,8 +1,53 @@
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
-import aiohttp
+from typing import List, Optional
+from selectolax.lexbor import LexborHTMLParser
+import functools
+import logging
 from datetime import datetime
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, JobRecord, normalize_job_batch
+
+_log = logging.getLogger(__name__)
+
+def _parse_search_results_html(html: bytes, base_url: str) -> List[JobRecord]:
+    """Parse job listings from a search results page.
+
+    Module-level so it can be pickled and run in a worker process.
+
+    Args:
+        html (bytes): Raw UTF-8 HTML of an Indeed search results page
+        base_url (str): Indeed base URL used to absolutize job links
+
+    Returns:
+        List[JobRecord]: Normalized job listings found on the page
+    """
+    jobs = []
+    job_cards = LexborHTMLParser(html).css('div.job_seen_beacon')
+    
+    for card in job_cards:
+        try:
+            job_data = {
+                'title': card.css_first('h2.jobTitle').text(strip=True),
+                'company': card.css_first('span.companyName').text(strip=True),
+                'location': card.css_first('div.companyLocation').text(strip=True),
+                'url': base_url + card.css_first('a.jcs-JobTitle').attributes['href'],
+                'description': card.css_first('div.job-snippet').text(strip=True),
+                'posted_date': datetime.now().isoformat(),
+                'source': 'Indeed'
+            }
+            jobs.append(job_data)
+        except Exception as e:
+            _log.warning("Error parsing job card: %s", e)
+    
+    return normalize_job_batch(jobs, IndeedScraper.__name__)
+
+@functools.lru_cache(maxsize=256)
+def _cached_search_url(base_url: str, query: str, location: Optional[str], page: int) -> str:
+    """Build Indeed search URL with parameters, cached across repeated searches."""
+    base_query = f"/jobs?q={query.replace(' ', '+')}"
+    if location:
+        base_query += f"&l={location.replace(' ', '+')}"
+    if page > 0:
+        base_query += f"&start={page * 10}"
+    return f"{base_url}{base_query}"
 
 class IndeedScraper(BaseScraper):
     """Scraper for Indeed job listings."""
@@ -14,7 +59,7 @@ class IndeedScraper(BaseScraper):
         }
 
     async def search_jobs(self, query: str, location: Optional[str] = None, 
-                         num_pages: int = 1) -> List[Dict]:
+                         num_pages: int = 1) -> List[JobRecord]:
         """Search for jobs on Indeed.
 
         Args:
@@ -23,92 +68,34 @@ class IndeedScraper(BaseScraper):
             num_pages (int, optional): Number of pages to scrape. Defaults to 1.
 
         Returns:
-            List[Dict]: List of job listings
+            List[JobRecord]: List of job listings
         """
-        jobs = []
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            for page in range(num_pages):
-                url = self._build_search_url(query, location, page)
-                try:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            soup = BeautifulSoup(html, 'html.parser')
-                            jobs.extend(self._parse_search_results(soup))
-                except Exception as e:
-                    print(f"Error scraping page {page}: {str(e)}")
-        return jobs
-
-    async def get_job_details(self, job_url: str) -> Dict:
-        """Get detailed job information from Indeed listing.
-
-        Args:
-            job_url (str): URL of the job listing
-
-        Returns:
-            Dict: Detailed job information
-        """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            try:
-                async with session.get(job_url) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        return self._parse_job_details(soup, job_url)
-            except Exception as e:
-                print(f"Error getting job details: {str(e)}")
-        return {}
+        urls = [self._build_search_url(query, location, page) for page in range(num_pages)]
+        return await self._search_pages(urls, _parse_search_results_html, self.base_url)
 
     def _build_search_url(self, query: str, location: Optional[str], page: int) -> str:
         """Build Indeed search URL with parameters."""
-        base_query = f"/jobs?q={query.replace(' ', '+')}"
-        if location:
-            base_query += f"&l={location.replace(' ', '+')}"
-        if page > 0:
-            base_query += f"&start={page * 10}"
-        return f"{self.base_url}{base_query}"
-
-    def _parse_search_results(self, soup: BeautifulSoup) -> List[Dict]:
-        """Parse job listings from search results page."""
-        jobs = []
-        job_cards = soup.find_all('div', class_='job_seen_beacon')
-        
-        for card in job_cards:
-            try:
-                job_data = {
-                    'title': card.find('h2', class_='jobTitle').get_text(strip=True),
-                    'company': card.find('span', class_='companyName').get_text(strip=True),
-                    'location': card.find('div', class_='companyLocation').get_text(strip=True),
-                    'url': self.base_url + card.find('a', class_='jcs-JobTitle')['href'],
-                    'description': card.find('div', class_='job-snippet').get_text(strip=True),
-                    'posted_date': datetime.now().isoformat(),
-                    'source': 'Indeed'
-                }
-                jobs.append(self._normalize_job_data(job_data))
-            except Exception as e:
-                print(f"Error parsing job card: {str(e)}")
-        
-        return jobs
+        return _cached_search_url(self.base_url, query, location, page)
 
-    def _parse_job_details(self, soup: BeautifulSoup, job_url: str) -> Dict:
+    def _parse_job_details(self, tree: LexborHTMLParser, job_url: str) -> Optional[JobRecord]:
         """Parse detailed job information."""
         try:
             job_data = {
-                'title': soup.find('h1', class_='jobsearch-JobInfoHeader-title').get_text(strip=True),
-                'company': soup.find('div', class_='jobsearch-CompanyInfoContainer').get_text(strip=True),
-                'location': soup.find('div', class_='jobsearch-JobInfoHeader-subtitle').get_text(strip=True),
-                'description': soup.find('div', id='jobDescriptionText').get_text(strip=True),
+                'title': tree.css_first('h1.jobsearch-JobInfoHeader-title').text(strip=True),
+                'company': tree.css_first('div.jobsearch-CompanyInfoContainer').text(strip=True),
+                'location': tree.css_first('div.jobsearch-JobInfoHeader-subtitle').text(strip=True),
+                'description': tree.css_first('div#jobDescriptionText').text(strip=True),
                 'url': job_url,
                 'posted_date': datetime.now().isoformat(),
                 'source': 'Indeed'
             }
 
             # Extract salary if available
-            salary_element = soup.find('div', class_='jobsearch-JobMetadataHeader-item')
+            salary_element = tree.css_first('div.jobsearch-JobMetadataHeader-item')
             if salary_element:
-                job_data['salary_range'] = salary_element.get_text(strip=True)
+                job_data['salary_range'] = salary_element.text(strip=True)
 
             return self._normalize_job_data(job_data)
         except Exception as e:
-            print(f"Error parsing job details: {str(e)}")
-            return {}
\ No newline at end of file
+            _log.warning("Error parsing job details for %s: %s", job_url, e)
+            return None
\ No newline at end of file
@@ -1,8 +1,88 @@
 from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
-import aiohttp
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+import logging
+from urllib.parse import quote, urlencode
 from datetime import datetime
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, JobRecord, normalize_job_batch
+
+_log = logging.getLogger(__name__)
+
+# Source stored on every parsed job
+_SOURCE = 'LinkedIn'
+
+# CSS selectors, defined once for every card and detail page
+_CARD_SELECTOR = 'div.base-card'
+_DETAIL_TITLE_SELECTOR = 'h1.top-card-layout__title'
+_DETAIL_COMPANY_SELECTOR = 'a.topcard__org-name-link'
+_DETAIL_LOCATION_SELECTOR = 'span.topcard__flavor--bullet'
+_DETAIL_DESCRIPTION_SELECTOR = 'div.description__text'
+_SALARY_SELECTOR = 'span.compensation__salary'
+_SKILLS_SECTION_SELECTOR = 'section.skills-section'
+_SKILL_SELECTOR = 'span.skill-pill'
+
+# Search-card fields by (tag, class), fetched with one selector query per card
+_CARD_FIELDS = {
+    ('h3', 'base-search-card__title'): 'title',
+    ('h4', 'base-search-card__subtitle'): 'company',
+    ('span', 'job-search-card__location'): 'location',
+    ('a', 'base-card__full-link'): 'url',
+    ('div', 'base-search-card__metadata'): 'description',
+}
+_CARD_FIELDS_SELECTOR = ', '.join(f'{tag}.{cls}' for tag, cls in _CARD_FIELDS)
+# Field class names, so utility classes on the same nodes are rejected with one set lookup
+_CARD_FIELD_CLASSES = frozenset(cls for _, cls in _CARD_FIELDS)
+
+def _parse_search_results_html(html: bytes) -> List[JobRecord]:
+    """Parse job listings from a search results page.
+
+    Module-level so it can be pickled and run in a worker process.
+
+    Args:
+        html (bytes): Raw UTF-8 HTML of a LinkedIn search results page
+
+    Returns:
+        List[JobRecord]: Normalized job listings found on the page
+    """
+    # A page without any card markup has nothing to parse
+    if b'base-card' not in html:
+        return []
+
+    jobs: List[Dict] = []
+    # Every card on a page is scraped at the same moment, so format the timestamp once
+    now_iso: str = datetime.now().isoformat()
+    job_cards: List[LexborNode] = LexborHTMLParser(html).css(_CARD_SELECTOR)
+    
+    card: LexborNode
+    for card in job_cards:
+        # One pass over the card collects every field node; the first match per field wins
+        fields: Dict[str, LexborNode] = {}
+        for node in card.css(_CARD_FIELDS_SELECTOR):
+            for cls in (node.attributes.get('class') or '').split():
+                if cls in _CARD_FIELD_CLASSES:
+                    field = _CARD_FIELDS.get((node.tag, cls))
+                    if field is not None:
+                        fields.setdefault(field, node)
+
+        # A title and a link identify the listing; LinkedIn often leaves out the rest
+        title = fields.get('title')
+        link = fields.get('url')
+        url = link.attributes.get('href') if link is not None else None
+        if title is None or not url:
+            _log.warning("Skipping job card without a title or link")
+            continue
+
+        job_data = {
+            'title': title.text(strip=True),
+            'url': url,
+            'posted_date': now_iso,
+            'source': _SOURCE
+        }
+        for field in ('company', 'location', 'description'):
+            if (node := fields.get(field)) is not None:
+                job_data[field] = node.text(strip=True)
+        jobs.append(job_data)
+    
+    return normalize_job_batch(jobs, LinkedInScraper.__name__)
 
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn job listings."""
@@ -15,7 +95,7 @@ class LinkedInScraper(BaseScraper):
         }
 
     async def search_jobs(self, query: str, location: Optional[str] = None, 
-                         num_pages: int = 1) -> List[Dict]:
+                         num_pages: int = 1) -> List[JobRecord]:
         """Search for jobs on LinkedIn.
 
         Args:
@@ -24,98 +104,46 @@ class LinkedInScraper(BaseScraper):
             num_pages (int, optional): Number of pages to scrape. Defaults to 1.
 
         Returns:
-            List[Dict]: List of job listings
+            List[JobRecord]: List of job listings
         """
-        jobs = []
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            for page in range(num_pages):
-                url = self._build_search_url(query, location, page)
-                try:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            soup = BeautifulSoup(html, 'html.parser')
-                            jobs.extend(self._parse_search_results(soup))
-                except Exception as e:
-                    print(f"Error scraping page {page}: {str(e)}")
-        return jobs
-
-    async def get_job_details(self, job_url: str) -> Dict:
-        """Get detailed job information from LinkedIn listing.
-
-        Args:
-            job_url (str): URL of the job listing
-
-        Returns:
-            Dict: Detailed job information
-        """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            try:
-                async with session.get(job_url) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        return self._parse_job_details(soup, job_url)
-            except Exception as e:
-                print(f"Error getting job details: {str(e)}")
-        return {}
+        urls = [self._build_search_url(query, location, page) for page in range(num_pages)]
+        return await self._search_pages(urls, _parse_search_results_html)
 
     def _build_search_url(self, query: str, location: Optional[str], page: int) -> str:
         """Build LinkedIn search URL with parameters."""
-        base_query = f"/jobs/search?keywords={query.replace(' ', '%20')}"
+        params = {'keywords': query}
         if location:
-            base_query += f"&location={location.replace(' ', '%20')}"
+            params['location'] = location
         if page > 0:
-            base_query += f"&start={page * 25}"
-        return f"{self.base_url}{base_query}"
-
-    def _parse_search_results(self, soup: BeautifulSoup) -> List[Dict]:
-        """Parse job listings from search results page."""
-        jobs = []
-        job_cards = soup.find_all('div', class_='base-card')
-        
-        for card in job_cards:
-            try:
-                job_data = {
-                    'title': card.find('h3', class_='base-search-card__title').get_text(strip=True),
-                    'company': card.find('h4', class_='base-search-card__subtitle').get_text(strip=True),
-                    'location': card.find('span', class_='job-search-card__location').get_text(strip=True),
-                    'url': card.find('a', class_='base-card__full-link')['href'],
-                    'description': card.find('div', class_='base-search-card__metadata').get_text(strip=True),
-                    'posted_date': datetime.now().isoformat(),
-                    'source': 'LinkedIn'
-                }
-                jobs.append(self._normalize_job_data(job_data))
-            except Exception as e:
-                print(f"Error parsing job card: {str(e)}")
-        
-        return jobs
-
-    def _parse_job_details(self, soup: BeautifulSoup, job_url: str) -> Dict:
+            params['start'] = page * 25
+        return f"{self.base_url}/jobs/search?{urlencode(params, quote_via=quote)}"
+
+    def _parse_job_details(self, tree: LexborHTMLParser, job_url: str) -> Optional[JobRecord]:
         """Parse detailed job information."""
-        try:
-            job_data = {
-                'title': soup.find('h1', class_='top-card-layout__title').get_text(strip=True),
-                'company': soup.find('a', class_='topcard__org-name-link').get_text(strip=True),
-                'location': soup.find('span', class_='topcard__flavor--bullet').get_text(strip=True),
-                'description': soup.find('div', class_='description__text').get_text(strip=True),
-                'url': job_url,
-                'posted_date': datetime.now().isoformat(),
-                'source': 'LinkedIn'
-            }
-
-            # Extract salary if available
-            salary_element = soup.find('span', class_='compensation__salary')
-            if salary_element:
-                job_data['salary_range'] = salary_element.get_text(strip=True)
-
-            # Extract skills from job description
-            skills_section = soup.find('section', class_='skills-section')
-            if skills_section:
-                skills = [skill.get_text(strip=True) for skill in skills_section.find_all('span', class_='skill-pill')]
-                job_data['skills'] = skills
-
-            return self._normalize_job_data(job_data)
-        except Exception as e:
-            print(f"Error parsing job details: {str(e)}")
-            return {}
\ No newline at end of file
+        title = tree.css_first(_DETAIL_TITLE_SELECTOR)
+        if title is None:
+            _log.warning("No job title found in details for %s", job_url)
+            return None
+
+        job_data = {
+            'title': title.text(strip=True),
+            'url': job_url,
+            'posted_date': datetime.now().isoformat(),
+            'source': _SOURCE
+        }
+        if (company := tree.css_first(_DETAIL_COMPANY_SELECTOR)) is not None:
+            job_data['company'] = company.text(strip=True)
+        if (location := tree.css_first(_DETAIL_LOCATION_SELECTOR)) is not None:
+            job_data['location'] = location.text(strip=True)
+        if (description := tree.css_first(_DETAIL_DESCRIPTION_SELECTOR)) is not None:
+            job_data['description'] = description.text(strip=True)
+
+        # Extract salary if available
+        if (salary_element := tree.css_first(_SALARY_SELECTOR)) is not None:
+            job_data['salary_range'] = salary_element.text(strip=True)
+
+        # Extract skills from job description
+        if (skills_section := tree.css_first(_SKILLS_SECTION_SELECTOR)) is not None:
+            job_data['skills'] = [skill.text(strip=True) for skill in skills_section.css(_SKILL_SELECTOR)]
+
+        return self._normalize_job_data(job_data)
\ No newline at end of file